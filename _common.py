@@ -0,0 +1,40 @@
+"""Settings shared by the import and validation scripts."""
+
+from __future__ import annotations
+
+import os
+from typing import Dict
+
+try:  # Optional; falls back silently if python-dotenv isn't installed.
+    from dotenv import load_dotenv
+except ImportError:  # pragma: no cover - best effort import
+    load_dotenv = lambda *args, **kwargs: None
+
+CSV_FILES = {
+    "covid_cases": "covid_cases.csv",
+    "hospital_data": "hospital_data.csv",
+    "vaccination_data": "vaccination_data.csv",
+    "country_demographics": "country_demographics.csv",
+    "testing_data": "testing_data.csv",
+}
+
+
+def load_db_config() -> Dict[str, str]:
+    """Load database credentials from environment variables."""
+    load_dotenv()
+    config = {
+        "host": os.getenv("COVID_DB_HOST", "localhost"),
+        "user": os.getenv("COVID_DB_USER", "root"),
+        "password": os.getenv("COVID_DB_PASSWORD", ""),
+        "database": os.getenv("COVID_DB_NAME", "covid19_analysis"),
+    }
+    missing = [
+        key for key, value in config.items() if value == "" and key != "password"
+    ]
+    if missing:
+        print(
+            "⚠ Using default DB config for: "
+            + ", ".join(missing)
+            + ". Set COVID_DB_* env vars or a .env file to override."
+        )
+    return config
@@ -4,7 +4,8 @@
 from __future__ import annotations
 
 import argparse
-import random
+import csv
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -13,6 +14,12 @@ from typing import Iterable, Sequence
 import numpy as np
 import pandas as pd
 
+try:  # Optional; DatasetBundle.save falls back to pandas' writer without it.
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - best effort import
+    pa = None
+
 DEFAULT_COUNTRIES = [
     "India",
     "USA",
@@ -72,7 +79,67 @@ class DatasetBundle:
             "testing_data.csv": self.testing_data,
         }
         for filename, df in files.items():
-            df.to_csv(output_dir / filename, index=False)
+            write_csv(df, output_dir / filename)
+
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write ``df`` to ``path``, preferring PyArrow's CSV writer when available."""
+    df = format_floats(df)
+    if pa is not None:
+        try:
+            with path.open("wb") as sink:
+                # Arrow always quotes header names, so emit the header ourselves.
+                sink.write((",".join(df.columns) + "\n").encode())
+                pacsv.write_csv(
+                    to_arrow_table(df),
+                    sink,
+                    write_options=pacsv.WriteOptions(
+                        include_header=False, quoting_style="none"
+                    ),
+                )
+            return
+        except pa.ArrowInvalid:
+            pass  # A value needs quoting; pandas' writer handles that case.
+    df.to_csv(
+        path,
+        index=False,
+        quoting=csv.QUOTE_MINIMAL,
+        lineterminator="\n",
+        date_format="%Y-%m-%d",
+    )
+
+
+def format_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """Render float columns as text so both CSV writers emit identical values.
+
+    Arrow prints whole-valued floats as ``8`` while ``to_csv`` prints ``8.0``;
+    formatting with ``repr`` up front pins the ``to_csv`` spelling. Missing
+    values stay missing and are written as empty fields by either writer.
+    """
+    floats = df.select_dtypes("float").columns
+    if floats.empty:
+        return df
+    return df.assign(
+        **{col: df[col].map(repr).where(df[col].notna()) for col in floats}
+    )
+
+
+def to_arrow_table(df: pd.DataFrame) -> "pa.Table":
+    """Convert a frame to Arrow with CSV-friendly column types.
+
+    Timestamps become plain dates and categoricals are decoded to strings so
+    dates and labels are written the same way ``DataFrame.to_csv`` writes them.
+    Float columns are expected to be pre-formatted by :func:`format_floats`.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    fields = []
+    for field in table.schema:
+        if pa.types.is_timestamp(field.type):
+            field = field.with_type(pa.date32())
+        elif pa.types.is_dictionary(field.type):
+            field = field.with_type(field.type.value_type)
+        fields.append(field)
+    return table.cast(pa.schema(fields))
 
 
 def date_range(start: datetime, end: datetime) -> pd.DatetimeIndex:
@@ -82,133 +149,166 @@ def date_range(start: datetime, end: datetime) -> pd.DatetimeIndex:
 
 
 def build_covid_cases(
-    dates: Sequence[pd.Timestamp], countries: Sequence[str], rng: random.Random
+    dates: pd.DatetimeIndex, countries: Sequence[str], rng: np.random.Generator
 ) -> pd.DataFrame:
-    records = []
-    for country in countries:
-        base_cases = rng.randint(100, 1000)
-        cumulative_cases = 0
-        cumulative_deaths = 0
-        cumulative_recovered = 0
-
-        for i, current_date in enumerate(dates):
-            wave_factor = 1 + 0.5 * np.sin(i / 90) + 0.3 * np.sin(i / 180)
-            if i < 60:
-                daily_cases = int(base_cases * wave_factor * (1 + i / 100))
-            elif i < 365:
-                daily_cases = int(base_cases * wave_factor * (1 + i / 50))
-            elif i < 730:
-                daily_cases = int(base_cases * wave_factor * (2 + i / 40))
-            else:
-                daily_cases = int(base_cases * wave_factor * (1.5 + i / 100))
-
-            daily_cases = max(0, int(daily_cases * rng.uniform(0.7, 1.3)))
-            daily_deaths = int(daily_cases * rng.uniform(0.02, 0.03))
-            daily_recovered = (
-                int(daily_cases * rng.uniform(0.90, 0.95)) if i > 14 else 0
-            )
-
-            cumulative_cases += daily_cases
-            cumulative_deaths += daily_deaths
-            cumulative_recovered += daily_recovered
-            active_cases = max(0, cumulative_cases - cumulative_deaths - cumulative_recovered)
-
-            records.append(
-                {
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "country": country,
-                    "daily_cases": daily_cases,
-                    "daily_deaths": daily_deaths,
-                    "daily_recovered": daily_recovered,
-                    "cumulative_cases": cumulative_cases,
-                    "cumulative_deaths": cumulative_deaths,
-                    "cumulative_recovered": cumulative_recovered,
-                    "active_cases": active_cases,
-                }
-            )
-    return pd.DataFrame(records)
+    n_days = len(dates)
+    shape = (len(countries), n_days)
+    i = np.arange(n_days)
+    wave_factor = 1 + 0.5 * np.sin(i / 90) + 0.3 * np.sin(i / 180)
+    multiplier = np.select(
+        [i < 60, i < 365, i < 730],
+        [1 + i / 100, 1 + i / 50, 2 + i / 40],
+        default=1.5 + i / 100,
+    )
+    trend = wave_factor * multiplier
+
+    # Countries on axis 0, days on axis 1; cumulatives run along the day axis.
+    base_cases = rng.integers(100, 1000, size=(len(countries), 1), endpoint=True)
+    daily_cases = (base_cases * trend).astype(np.int64)
+    daily_cases = np.maximum(
+        0, (daily_cases * rng.uniform(0.7, 1.3, shape)).astype(np.int64)
+    )
+    daily_deaths = (daily_cases * rng.uniform(0.02, 0.03, shape)).astype(np.int64)
+    daily_recovered = np.where(
+        i > 14, daily_cases * rng.uniform(0.90, 0.95, shape), 0
+    ).astype(np.int64)
+
+    cumulative_cases = np.cumsum(daily_cases, axis=1)
+    cumulative_deaths = np.cumsum(daily_deaths, axis=1)
+    cumulative_recovered = np.cumsum(daily_recovered, axis=1)
+    active_cases = np.maximum(
+        0, cumulative_cases - cumulative_deaths - cumulative_recovered
+    )
+
+    return pd.DataFrame(
+        {
+            "date": np.tile(dates.to_numpy(), len(countries)),
+            "country": pd.Categorical.from_codes(
+                np.repeat(np.arange(len(countries)), n_days), categories=countries
+            ),
+            "daily_cases": daily_cases.ravel(),
+            "daily_deaths": daily_deaths.ravel(),
+            "daily_recovered": daily_recovered.ravel(),
+            "cumulative_cases": cumulative_cases.ravel(),
+            "cumulative_deaths": cumulative_deaths.ravel(),
+            "cumulative_recovered": cumulative_recovered.ravel(),
+            "active_cases": active_cases.ravel(),
+        },
+        copy=False,
+    )
 
 
 def build_hospital_data(
-    dates: Sequence[pd.Timestamp], states: Sequence[str], rng: random.Random
+    dates: pd.DatetimeIndex, states: Sequence[str], rng: np.random.Generator
 ) -> pd.DataFrame:
-    records = []
-    for i, current_date in enumerate(dates):
-        wave_factor = 1 + 0.5 * np.sin(i / 90)
-        for state in states:
-            base_admissions = rng.randint(50, 500)
-            daily_admissions = max(
-                0, int(base_admissions * wave_factor * rng.uniform(0.8, 1.2))
-            )
-            icu_admissions = int(daily_admissions * rng.uniform(0.15, 0.25))
-            ventilator_usage = int(icu_admissions * rng.uniform(0.3, 0.5))
-
-            records.append(
-                {
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "state": state,
-                    "country": "India",
-                    "hospital_admissions": daily_admissions,
-                    "icu_admissions": icu_admissions,
-                    "ventilator_usage": ventilator_usage,
-                    "available_beds": rng.randint(100, 1000),
-                    "available_icu_beds": rng.randint(10, 100),
-                }
-            )
-    return pd.DataFrame(records)
+    n_days = len(dates)
+    shape = (n_days, len(states))
+    wave_factor = (1 + 0.5 * np.sin(np.arange(n_days) / 90))[:, None]
+
+    base_admissions = rng.integers(50, 500, size=shape, endpoint=True)
+    daily_admissions = np.maximum(
+        0,
+        (base_admissions * wave_factor * rng.uniform(0.8, 1.2, shape)).astype(np.int64),
+    )
+    icu_admissions = (daily_admissions * rng.uniform(0.15, 0.25, shape)).astype(
+        np.int64
+    )
+    ventilator_usage = (icu_admissions * rng.uniform(0.3, 0.5, shape)).astype(np.int64)
+
+    return pd.DataFrame(
+        {
+            "date": np.repeat(dates.to_numpy(), len(states)),
+            "state": pd.Categorical.from_codes(
+                np.tile(np.arange(len(states)), n_days), categories=states
+            ),
+            "country": pd.Categorical.from_codes(
+                np.zeros(daily_admissions.size, dtype=np.int8), categories=["India"]
+            ),
+            "hospital_admissions": daily_admissions.ravel(),
+            "icu_admissions": icu_admissions.ravel(),
+            "ventilator_usage": ventilator_usage.ravel(),
+            "available_beds": rng.integers(
+                100, 1000, size=shape, endpoint=True
+            ).ravel(),
+            "available_icu_beds": rng.integers(
+                10, 100, size=shape, endpoint=True
+            ).ravel(),
+        },
+        copy=False,
+    )
+
+
+def piecewise_integers(
+    rng: np.random.Generator,
+    shape: tuple[int, int],
+    segments: Sequence[tuple[int | None, int, int]],
+) -> np.ndarray:
+    """Draw integers whose inclusive ``[low, high]`` range changes by day.
+
+    ``segments`` is a list of ``(end_day, low, high)`` tiers, each covering the
+    days up to (but excluding) ``end_day``; the last tier uses ``None``.
+    """
+    day = np.arange(shape[1])
+    tiers, (_, last_low, last_high) = segments[:-1], segments[-1]
+    conditions = [day < end_day for end_day, _, _ in tiers]
+    low = np.select(conditions, [low for _, low, _ in tiers], default=last_low)
+    high = np.select(conditions, [high for _, _, high in tiers], default=last_high)
+    return rng.integers(low, high, size=shape, endpoint=True)
 
 
 def build_vaccination_data(
-    start_date: datetime,
-    end_date: datetime,
-    countries: Sequence[str],
-    rng: random.Random,
+    dates: pd.DatetimeIndex, countries: Sequence[str], rng: np.random.Generator
 ) -> pd.DataFrame:
-    vax_dates = date_range(max(start_date, DEFAULT_VACCINATION_START), end_date)
-    records = []
-    for country in countries:
-        cumulative_dose1 = 0
-        cumulative_dose2 = 0
-        cumulative_booster = 0
-        for i, current_date in enumerate(vax_dates):
-            if i < 90:
-                daily_dose1 = rng.randint(10_000, 100_000)
-                daily_dose2 = rng.randint(5_000, 50_000) if i > 30 else 0
-                daily_booster = 0
-            elif i < 365:
-                daily_dose1 = rng.randint(100_000, 500_000)
-                daily_dose2 = rng.randint(50_000, 400_000)
-                daily_booster = rng.randint(10_000, 100_000) if i > 270 else 0
-            else:
-                daily_dose1 = rng.randint(50_000, 200_000)
-                daily_dose2 = rng.randint(40_000, 180_000)
-                daily_booster = rng.randint(50_000, 150_000)
-
-            cumulative_dose1 += daily_dose1
-            cumulative_dose2 += daily_dose2
-            cumulative_booster += daily_booster
-
-            records.append(
-                {
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "country": country,
-                    "daily_vaccinations_dose1": daily_dose1,
-                    "daily_vaccinations_dose2": daily_dose2,
-                    "daily_vaccinations_booster": daily_booster,
-                    "cumulative_dose1": cumulative_dose1,
-                    "cumulative_dose2": cumulative_dose2,
-                    "cumulative_booster": cumulative_booster,
-                    "total_vaccinations": cumulative_dose1
-                    + cumulative_dose2
-                    + cumulative_booster,
-                }
-            )
-    return pd.DataFrame(records)
+    # Reuse the shared series from the start of the vaccination campaign.
+    vax_dates = dates[dates.searchsorted(DEFAULT_VACCINATION_START) :]
+    n_days = len(vax_dates)
+    shape = (len(countries), n_days)
+
+    daily_dose1 = piecewise_integers(
+        rng,
+        shape,
+        [(90, 10_000, 100_000), (365, 100_000, 500_000), (None, 50_000, 200_000)],
+    )
+    daily_dose2 = piecewise_integers(
+        rng,
+        shape,
+        [
+            (31, 0, 0),
+            (90, 5_000, 50_000),
+            (365, 50_000, 400_000),
+            (None, 40_000, 180_000),
+        ],
+    )
+    daily_booster = piecewise_integers(
+        rng, shape, [(271, 0, 0), (365, 10_000, 100_000), (None, 50_000, 150_000)]
+    )
+    cumulative_dose1 = np.cumsum(daily_dose1, axis=1)
+    cumulative_dose2 = np.cumsum(daily_dose2, axis=1)
+    cumulative_booster = np.cumsum(daily_booster, axis=1)
+
+    return pd.DataFrame(
+        {
+            "date": np.tile(vax_dates.to_numpy(), len(countries)),
+            "country": pd.Categorical.from_codes(
+                np.repeat(np.arange(len(countries)), n_days), categories=countries
+            ),
+            "daily_vaccinations_dose1": daily_dose1.ravel(),
+            "daily_vaccinations_dose2": daily_dose2.ravel(),
+            "daily_vaccinations_booster": daily_booster.ravel(),
+            "cumulative_dose1": cumulative_dose1.ravel(),
+            "cumulative_dose2": cumulative_dose2.ravel(),
+            "cumulative_booster": cumulative_booster.ravel(),
+            "total_vaccinations": (
+                cumulative_dose1 + cumulative_dose2 + cumulative_booster
+            ).ravel(),
+        },
+        copy=False,
+    )
 
 
 def build_demographics(countries: Sequence[str]) -> pd.DataFrame:
     data = {
-        "country": countries,
+        "country": pd.Categorical(countries, categories=countries),
         "population": [
             1393409038,
             331893745,
@@ -324,28 +424,26 @@ def build_demographics(countries: Sequence[str]) -> pd.DataFrame:
 
 
 def build_testing_data(
-    dates: Sequence[pd.Timestamp], countries: Sequence[str], rng: random.Random
+    dates: pd.DatetimeIndex, countries: Sequence[str], rng: np.random.Generator
 ) -> pd.DataFrame:
-    records = []
-    for country in countries:
-        cumulative_tests = 0
-        for i, current_date in enumerate(dates):
-            if i < 60:
-                daily_tests = rng.randint(1_000, 10_000)
-            elif i < 180:
-                daily_tests = rng.randint(10_000, 100_000)
-            else:
-                daily_tests = rng.randint(100_000, 1_000_000)
-            cumulative_tests += daily_tests
-            records.append(
-                {
-                    "date": current_date.strftime("%Y-%m-%d"),
-                    "country": country,
-                    "daily_tests": daily_tests,
-                    "cumulative_tests": cumulative_tests,
-                }
-            )
-    return pd.DataFrame(records)
+    n_days = len(dates)
+    daily_tests = piecewise_integers(
+        rng,
+        (len(countries), n_days),
+        [(60, 1_000, 10_000), (180, 10_000, 100_000), (None, 100_000, 1_000_000)],
+    )
+
+    return pd.DataFrame(
+        {
+            "date": np.tile(dates.to_numpy(), len(countries)),
+            "country": pd.Categorical.from_codes(
+                np.repeat(np.arange(len(countries)), n_days), categories=countries
+            ),
+            "daily_tests": daily_tests.ravel(),
+            "cumulative_tests": np.cumsum(daily_tests, axis=1).ravel(),
+        },
+        copy=False,
+    )
 
 
 def generate_bundle(
@@ -354,24 +452,52 @@ def generate_bundle(
     countries: Sequence[str],
     states: Sequence[str],
     rng_seed: int,
+    max_workers: int = 1,
 ) -> DatasetBundle:
-    rng = random.Random(rng_seed)
-    np.random.seed(rng_seed)
+    # Each builder gets an independent child stream so results are identical
+    # whether they run in-process or in a pool, in any order.
+    covid_seed, hospital_seed, vaccination_seed, testing_seed = np.random.SeedSequence(
+        rng_seed
+    ).spawn(4)
 
     dates = date_range(start, end)
-    covid_cases = build_covid_cases(dates, countries, rng)
-    hospital_data = build_hospital_data(dates, states, rng)
-    vaccination_data = build_vaccination_data(start, end, countries, rng)
-    demographics = build_demographics(countries)
-    testing_data = build_testing_data(dates, countries, rng)
-
-    return DatasetBundle(
-        covid_cases=covid_cases,
-        hospital_data=hospital_data,
-        vaccination_data=vaccination_data,
-        country_demographics=demographics,
-        testing_data=testing_data,
-    )
+    jobs = {
+        "covid_cases": (
+            build_covid_cases,
+            dates,
+            countries,
+            np.random.default_rng(covid_seed),
+        ),
+        "hospital_data": (
+            build_hospital_data,
+            dates,
+            states,
+            np.random.default_rng(hospital_seed),
+        ),
+        "vaccination_data": (
+            build_vaccination_data,
+            dates,
+            countries,
+            np.random.default_rng(vaccination_seed),
+        ),
+        "testing_data": (
+            build_testing_data,
+            dates,
+            countries,
+            np.random.default_rng(testing_seed),
+        ),
+    }
+    # The vectorised builders finish in milliseconds, so worker start-up and
+    # pickling the frames back usually cost more than they save; only use a
+    # pool when explicitly asked for.
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {name: pool.submit(*job) for name, job in jobs.items()}
+            frames = {name: future.result() for name, future in futures.items()}
+    else:
+        frames = {name: builder(*args) for name, (builder, *args) in jobs.items()}
+
+    return DatasetBundle(country_demographics=build_demographics(countries), **frames)
 
 
 def print_summary(bundle: DatasetBundle) -> None:
@@ -387,6 +513,13 @@ def print_summary(bundle: DatasetBundle) -> None:
         print(f"{name:25s}: {count:,} records")
 
 
+def positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
 def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Generate synthetic COVID-19 datasets for the SQL project."
@@ -409,6 +542,12 @@ def parse_args(argv: Iterable[str] | None = None) -> argparse.Namespace:
         default=42,
         help="Random seed for reproducibility.",
     )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=1,
+        help="Worker processes used to build the datasets (default: 1, in-process).",
+    )
     parser.add_argument(
         "--output-dir",
         type=Path,
@@ -426,6 +565,7 @@ def main(argv: Iterable[str] | None = None) -> None:
         countries=DEFAULT_COUNTRIES,
         states=INDIA_STATES,
         rng_seed=args.seed,
+        max_workers=args.workers,
     )
     bundle.save(args.output_dir)
     print_summary(bundle)
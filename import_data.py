@@ -4,51 +4,39 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import os
 import sys
+from itertools import islice
 from pathlib import Path
 from typing import Dict, Iterable
 
-import pandas as pd
-import mysql.connector
-from mysql.connector import Error
+try:
+    import pandas as pd
+    import mysql.connector
+    from mysql.connector import Error
+except ImportError:
+    print("✗ Missing required packages. Install them with:\n  pip install -r requirements.txt")
+    sys.exit(1)
 
-try:  # Optional; falls back silently if python-dotenv isn't installed.
-    from dotenv import load_dotenv
+from _common import CSV_FILES, load_db_config
+
+try:  # Optional; pandas' multi-threaded Arrow parser when available.
+    import pyarrow  # noqa: F401
+    READ_CSV_ENGINE = 'pyarrow'
 except ImportError:  # pragma: no cover - best effort import
-    load_dotenv = lambda *args, **kwargs: None
-
-CSV_FILES = {
-    'covid_cases': 'covid_cases.csv',
-    'hospital_data': 'hospital_data.csv',
-    'vaccination_data': 'vaccination_data.csv',
-    'country_demographics': 'country_demographics.csv',
-    'testing_data': 'testing_data.csv',
-}
-
-
-def load_db_config() -> Dict[str, str]:
-    """Load database credentials from environment variables."""
-    load_dotenv()
-    config = {
-        'host': os.getenv('COVID_DB_HOST', 'localhost'),
-        'user': os.getenv('COVID_DB_USER', 'root'),
-        'password': os.getenv('COVID_DB_PASSWORD', ''),
-        'database': os.getenv('COVID_DB_NAME', 'covid19_analysis'),
-    }
-    missing = [key for key, value in config.items() if value == '' and key != 'password']
-    if missing:
-        print(
-            "⚠ Using default DB config for: " + ', '.join(missing) +
-            ". Set COVID_DB_* env vars or a .env file to override."
-        )
-    return config
-
-
-def create_connection(config: Dict[str, str]):
+    READ_CSV_ENGINE = 'c'
+
+
+def create_connection(config: Dict[str, str], *, local_infile=False, csv_dir=None):
     """Create database connection"""
+    options = {}
+    if local_infile:
+        # Let the server request only files under csv_dir. Passing
+        # allow_local_infile=True as well would lift this restriction.
+        options['allow_local_infile_in_path'] = str(Path(csv_dir).resolve())
     try:
-        connection = mysql.connector.connect(**config)
+        connection = mysql.connector.connect(**options, **config)
         if connection.is_connected():
             print("✓ Successfully connected to MySQL database")
             return connection
@@ -56,7 +44,23 @@ def create_connection(config: Dict[str, str]):
         print(f"✗ Error connecting to MySQL: {e}")
         sys.exit(1)
 
-def import_csv_to_table(connection, table_name, csv_file, *, reset=False, batch_size=1000):
+def load_data_local_infile(cursor, table_name, csv_file):
+    """Bulk-load a CSV with LOAD DATA LOCAL INFILE; return (rows loaded, rows in file)"""
+    with open(csv_file, newline='') as f:
+        reader = csv.reader(f)
+        cols = ','.join(next(reader))
+        expected = sum(1 for _ in reader)
+    path = Path(csv_file).resolve().as_posix().replace("'", "\\'")
+    cursor.execute(
+        f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {table_name} "
+        "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+        "LINES TERMINATED BY '\\n' IGNORE 1 LINES "
+        f"({cols})"
+    )
+    return cursor.rowcount, expected
+
+def import_csv_to_table(connection, table_name, csv_file, *, reset=False, batch_size=1000,
+                        local_infile=True):
     """Import CSV file into database table"""
     try:
         # Check if file exists
@@ -64,11 +68,6 @@ def import_csv_to_table(connection, table_name, csv_file, *, reset=False, batch_
             print(f"✗ File not found: {csv_file}")
             return False
 
-        # Read CSV file
-        print(f"\nReading {csv_file}...")
-        df = pd.read_csv(csv_file)
-        print(f"  Found {len(df)} records")
-
         cursor = connection.cursor()
 
         if reset:
@@ -80,6 +79,37 @@ def import_csv_to_table(connection, table_name, csv_file, *, reset=False, batch_
             if existing:
                 print(f"  Retaining {existing:,} existing rows (append mode)")
 
+        if local_infile:
+            # Let the server parse the file itself; much faster than INSERTs.
+            try:
+                print(f"\nLoading {csv_file} with LOAD DATA LOCAL INFILE...")
+                total_loaded, expected = load_data_local_infile(cursor, table_name, csv_file)
+                # LOCAL implies IGNORE: duplicate keys and bad values only
+                # raise warnings, so treat any warning or short load as failure.
+                if cursor.warning_count or total_loaded != expected:
+                    print(
+                        f"✗ Loaded {total_loaded}/{expected} records into {table_name} "
+                        f"with {cursor.warning_count} warning(s); rolling back"
+                    )
+                    cursor.execute("SHOW WARNINGS LIMIT 5")
+                    for level, code, message in cursor.fetchall():
+                        print(f"  {level} {code}: {message}")
+                    connection.rollback()
+                    cursor.close()
+                    return False
+                connection.commit()
+                print(f"✓ Successfully imported {total_loaded} records into {table_name}")
+                cursor.close()
+                return True
+            except Error as e:
+                connection.rollback()
+                print(f"  LOCAL INFILE unavailable ({e.msg}); falling back to batched INSERTs")
+
+        # Read CSV file
+        print(f"\nReading {csv_file}...")
+        df = pd.read_csv(csv_file, engine=READ_CSV_ENGINE)
+        print(f"  Found {len(df)} records")
+
         # Prepare insert statement
         cols = ','.join(df.columns)
         placeholders = ','.join(['%s'] * len(df.columns))
@@ -89,22 +119,25 @@ def import_csv_to_table(connection, table_name, csv_file, *, reset=False, batch_
             raise ValueError("batch_size must be positive")
         total_inserted = 0
 
-        for i in range(0, len(df), batch_size):
-            batch = df.iloc[i:i + batch_size]
-            values = [tuple(x) for x in batch.values]
-            cursor.executemany(insert_query, values)
-            connection.commit()
+        rows = df.itertuples(index=False, name=None)
+        while batch := list(islice(rows, batch_size)):
+            cursor.executemany(insert_query, batch)
             total_inserted += len(batch)
             print(f"  Inserted {total_inserted}/{len(df)} records...", end='\r')
 
+        # One commit per table: the whole file lands atomically and we avoid
+        # a server round-trip (and log flush) per batch.
+        connection.commit()
         print(f"\n✓ Successfully imported {total_inserted} records into {table_name}")
         cursor.close()
         return True
 
     except Error as e:
+        connection.rollback()
         print(f"\n✗ Error importing {csv_file}: {e}")
         return False
     except Exception as e:
+        connection.rollback()
         print(f"\n✗ Unexpected error: {e}")
         return False
 
@@ -140,6 +173,11 @@ def parse_args(argv: Iterable[str] | None = None):
         default=1000,
         help="Number of rows to insert per batch (default: 1000).",
     )
+    parser.add_argument(
+        "--no-local-infile",
+        action="store_true",
+        help="Skip LOAD DATA LOCAL INFILE and always use batched INSERTs.",
+    )
     parser.add_argument(
         "--tables",
         nargs="*",
@@ -179,7 +217,11 @@ def main(argv: Iterable[str] | None = None):
         print("\nPlease ensure all CSV files are present or specify --csv-dir correctly.")
         sys.exit(1)
 
-    connection = create_connection(load_db_config())
+    connection = create_connection(
+        load_db_config(),
+        local_infile=not args.no_local_infile,
+        csv_dir=csv_dir,
+    )
 
     success_count = 0
     for table_name in tables:
@@ -191,6 +233,7 @@ def main(argv: Iterable[str] | None = None):
             str(csv_file),
             reset=args.reset,
             batch_size=args.batch_size,
+            local_infile=not args.no_local_infile,
         ):
             success_count += 1
 
@@ -212,11 +255,4 @@ def main(argv: Iterable[str] | None = None):
         print("\n⚠ Some imports failed. Check error messages above.")
 
 if __name__ == "__main__":
-    try:
-        import pandas  # noqa: F401  (import check for helpful error)
-        import mysql.connector  # noqa: F401
-    except ImportError:
-        print("✗ Missing required packages. Install them with:\n  pip install -r requirements.txt")
-        sys.exit(1)
-
     main()
@@ -4,25 +4,11 @@
 from __future__ import annotations
 
 import argparse
-import os
 import sys
 from pathlib import Path
-from typing import Dict, Iterable
+from typing import Iterable
 
-import pandas as pd
-
-try:
-    from dotenv import load_dotenv
-except ImportError:  # pragma: no cover
-    load_dotenv = lambda *args, **kwargs: None
-
-CSV_FILES = {
-    "covid_cases": "covid_cases.csv",
-    "hospital_data": "hospital_data.csv",
-    "vaccination_data": "vaccination_data.csv",
-    "country_demographics": "country_demographics.csv",
-    "testing_data": "testing_data.csv",
-}
+from _common import CSV_FILES, load_db_config
 
 EXPECTED_ROWS = {
     "covid_cases": 35560,
@@ -54,21 +40,36 @@ def parse_args(argv: Iterable[str] | None = None):
         action="store_true",
         help="Also verify table counts in the configured MySQL database.",
     )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Only count CSV lines; skip parsing and the duplicate-key check.",
+    )
     return parser.parse_args(argv)
 
 
-def load_db_config() -> Dict[str, str]:
-    load_dotenv()
-    return {
-        "host": os.getenv("COVID_DB_HOST", "localhost"),
-        "user": os.getenv("COVID_DB_USER", "root"),
-        "password": os.getenv("COVID_DB_PASSWORD", ""),
-        "database": os.getenv("COVID_DB_NAME", "covid19_analysis"),
-    }
+def count_csv_rows(path: Path) -> int:
+    """Count data rows by scanning for newlines instead of parsing the CSV."""
+    newlines = 0
+    last = b"\n"
+    with path.open("rb") as f:
+        for buf in iter(lambda: f.read(1 << 20), b""):
+            newlines += buf.count(b"\n")
+            last = buf[-1:]
+    if last != b"\n":
+        newlines += 1  # Final line has no terminator.
+    return max(newlines - 1, 0)  # Exclude the header.
 
 
-def validate_csvs(csv_dir: Path) -> bool:
+def validate_csvs(csv_dir: Path, fast: bool = False) -> bool:
     print("\n=== Validating CSV files ===")
+    if not fast:
+        # Deferred so --fast runs never pay for importing pandas/pyarrow.
+        try:
+            import pyarrow.csv as pacsv
+        except ImportError:  # pragma: no cover
+            pacsv = None
+            import pandas as pd
     success = True
     for table, filename in CSV_FILES.items():
         path = csv_dir / filename
@@ -77,8 +78,15 @@ def validate_csvs(csv_dir: Path) -> bool:
             success = False
             continue
 
-        df = pd.read_csv(path)
-        row_count = len(df)
+        if fast:
+            row_count = count_csv_rows(path)
+        elif pacsv is not None:
+            # Arrow's reader is multi-threaded and avoids building a DataFrame.
+            arrow_table = pacsv.read_csv(path)
+            row_count = arrow_table.num_rows
+        else:
+            df = pd.read_csv(path)
+            row_count = len(df)
         expected = EXPECTED_ROWS.get(table)
         if expected is not None and row_count != expected:
             print(f"✗ {table}: expected {expected:,} rows, found {row_count:,}")
@@ -87,8 +95,15 @@ def validate_csvs(csv_dir: Path) -> bool:
             print(f"✓ {table}: {row_count:,} rows")
 
         key = UNIQUE_KEYS.get(table)
-        if key:
-            dupes = int(df.duplicated(subset=key).sum())
+        if key and not fast:
+            # Count distinct keys rather than materialising a duplicate mask.
+            if pacsv is not None:
+                n_unique = arrow_table.group_by(key).aggregate([]).num_rows
+            else:
+                n_unique = df.groupby(
+                    key, sort=False, observed=True, dropna=False
+                ).ngroups
+            dupes = row_count - n_unique
             if dupes:
                 print(f"  • WARN: {dupes} duplicate rows on key {key}")
                 success = False
@@ -125,7 +140,7 @@ def validate_database() -> bool:
 
 def main(argv: Iterable[str] | None = None) -> int:
     args = parse_args(argv)
-    csv_ok = validate_csvs(args.csv_dir)
+    csv_ok = validate_csvs(args.csv_dir, fast=args.fast)
     db_ok = True
     if args.check_db:
         db_ok = validate_database()